@@ -16,9 +16,18 @@ Quick summary:
 
 import argparse
 import asyncio
+import copy
+import ctypes
+import functools
+import hashlib
 import json
 import os
+import pathlib
+import shutil
+import struct
+import subprocess
 import sys
+import threading
 import io
 
 import discord
@@ -26,6 +35,9 @@ from discord import FFmpegPCMAudio
 from discord.ext import commands
 import time
 import traceback
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from types import MappingProxyType
 
 import logging
 import signal
@@ -47,6 +59,25 @@ if not logger.handlers:
 bot = None
 
 
+# Low-latency ffmpeg flags shared by every playback source. All audio here is
+# piped from memory (TTS output and recorded buffers), so aggressive input
+# buffering only delays the first decoded frame, and the banner/version spew
+# is skipped outright. `-nostdin` is deliberately absent: pipe=True feeds the
+# source through stdin.
+FFMPEG_BEFORE_OPTIONS = (
+    "-loglevel quiet -hide_banner -fflags nobuffer -flags low_delay -analyzeduration 0"
+)
+FFMPEG_OPTIONS = "-vn"
+
+
+# Fixed announcement spoken whenever the bot joins a voice channel. Kept as a
+# module constant so the audio can be synthesized once and replayed from memory.
+JOIN_ANNOUNCEMENT = (
+    "Voice tester has joined the channel. "
+    "No recordings unless explicitly triggered by a user."
+)
+
+
 # Static list of debug targets. Use these names with --debug or with individual
 # flags like --debug-voice, --debug-sinks, etc.
 DEBUG_TARGETS = [
@@ -57,20 +88,251 @@ DEBUG_TARGETS = [
     "config",
 ]
 
+# One bit per debug target so `debug_enabled` is a single AND instead of a
+# set membership test; it runs on every debug callsite in the audio path.
+_TARGET_BIT = {t: 1 << i for i, t in enumerate(DEBUG_TARGETS)}
+
 
-def redact_config(cfg: dict) -> dict:
-    """Return a shallow copy of the config suitable for logging without the token."""
+def redact_config(cfg: dict) -> "MappingProxyType | dict":
+    """Return a read-only view of the config suitable for logging without the token.
+
+    The proxy wraps a private shallow copy, so callers can render it but not
+    mutate it back into the live config by accident.
+    """
     if not isinstance(cfg, dict):
         return cfg
     out = dict(cfg)
     if "token" in out:
         out["token"] = "<redacted>"
-    return out
+    return MappingProxyType(out)
+
+
+# Prefer a C-backed JSON parser when one is installed; fall back to stdlib.
+# Neither is a hard dependency, so config parsing works out of the box.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+
+# Parsed-config cache keyed by (abspath, mtime_ns, size) so repeated loads
+# (tests, reloads) skip the read+parse entirely until the file changes.
+_CONFIG_CACHE: dict[tuple, dict] = {}
 
 
 def load_config(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        # Read raw bytes and let the parser handle UTF-8: this skips the
+        # TextIOWrapper/codec stack, avoiding one full decode pass.
+        try:
+            cached = _json_loads(pathlib.Path(path).read_bytes())
+        except json.JSONDecodeError:
+            raise
+        except ValueError as exc:
+            # orjson/ujson raise their own ValueError subclasses; normalize
+            # to the stdlib error type callers already expect.
+            raise json.JSONDecodeError(str(exc), "", 0) from exc
+        _CONFIG_CACHE.clear()  # only ever one live config; drop stale entries
+        _CONFIG_CACHE[key] = cached
+    # Return a copy so callers can mutate their config without poisoning the cache
+    return copy.deepcopy(cached)
+
+
+# Precomputed argv for the subprocesses this module spawns. Unpacking a
+# module-level tuple avoids rebuilding the argument list on every call.
+_ESPEAK_ARGV = ("espeak-ng", "--stdout")
+_PCM_TRANSCODE_ARGV = (
+    "ffmpeg",
+    "-i",
+    "pipe:0",
+    "-f",
+    "s16le",
+    "-ar",
+    "48000",
+    "-ac",
+    "2",
+    "pipe:1",
+)
+
+# Resolved once at import: spawning a subprocess just to discover the binary
+# is missing is far costlier than one PATH walk here.
+_TTS_BINARY = shutil.which(_ESPEAK_ARGV[0])
+
+# Hard ceiling on a single espeak-ng run; the phrases here are seconds long,
+# so anything past this is a wedged process, not slow synthesis.
+TTS_TIMEOUT = 10.0
+
+
+def _run_tts_sync(text: str) -> tuple[bytes, bytes, int]:
+    """Run the espeak-ng subprocess to completion; executed on the executor."""
+    proc = subprocess.run(
+        _ESPEAK_ARGV,
+        input=text.encode(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=TTS_TIMEOUT,
+    )
+    return proc.stdout, proc.stderr, proc.returncode
+
+
+# In-process synthesis via libespeak-ng. Spawning a fresh espeak-ng process
+# per announcement pays fork+exec+linker startup for every short phrase; the
+# library loaded once at import synthesizes straight into memory instead. The
+# subprocess path below remains as the fallback when the shared library is
+# missing, so nothing new becomes a hard dependency.
+_ESPEAK_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_ESPEAK_CHARS_UTF8 = 1
+
+_ESPEAK_CALLBACK_TYPE = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p
+)
+
+# libespeak is not reentrant: one lock serializes all synthesis, and the
+# callback appends into this buffer which is only touched under the lock.
+_espeak_lock = threading.Lock()
+_espeak_pcm = bytearray()
+
+
+def _espeak_on_samples(wav, numsamples, events):
+    # extend(), not +=: augmented assignment would rebind the module name as
+    # a local, and ctypes swallows the resulting UnboundLocalError inside the
+    # CFUNCTYPE trampoline, silently dropping every sample.
+    if numsamples > 0 and wav:
+        _espeak_pcm.extend(ctypes.string_at(wav, numsamples * 2))
+    return 0  # 0 = continue synthesis
+
+
+def _init_espeak():
+    """Load libespeak-ng and register the sample callback.
+
+    Returns (lib, callback, sample_rate) or (None, None, 0) when the shared
+    library is unavailable; the callback must stay referenced for the life of
+    the process or ctypes will garbage-collect the trampoline under espeak.
+    """
+    try:
+        lib = ctypes.CDLL("libespeak-ng.so.1")
+    except OSError:
+        return None, None, 0
+    try:
+        rate = lib.espeak_Initialize(_ESPEAK_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, 0)
+        if rate <= 0:
+            return None, None, 0
+        callback = _ESPEAK_CALLBACK_TYPE(_espeak_on_samples)
+        lib.espeak_SetSynthCallback(callback)
+        return lib, callback, rate
+    except Exception:
+        return None, None, 0
+
+
+_ESPEAK_LIB, _ESPEAK_CALLBACK, _ESPEAK_SAMPLE_RATE = _init_espeak()
+
+
+# The header layout is fixed once espeak's sample rate is known, so keep one
+# packed template and patch only the two length fields per synthesis. Callers
+# must hold _espeak_lock: the template is shared mutable state.
+_wav_header_template: bytearray | None = None
+_wav_header_rate = 0
+
+
+def _wav_header(num_pcm_bytes: int, sample_rate: int) -> bytes:
+    """Build a 44-byte RIFF header for 16-bit mono PCM at `sample_rate`."""
+    global _wav_header_template, _wav_header_rate
+    if _wav_header_template is None or _wav_header_rate != sample_rate:
+        _wav_header_template = bytearray(
+            struct.pack(
+                "<4sI4s4sIHHIIHH4sI",
+                b"RIFF",
+                0,  # patched per call
+                b"WAVE",
+                b"fmt ",
+                16,
+                1,  # PCM
+                1,  # mono
+                sample_rate,
+                sample_rate * 2,
+                2,
+                16,
+                b"data",
+                0,  # patched per call
+            )
+        )
+        _wav_header_rate = sample_rate
+    struct.pack_into("<I", _wav_header_template, 4, 36 + num_pcm_bytes)
+    struct.pack_into("<I", _wav_header_template, 40, num_pcm_bytes)
+    return bytes(_wav_header_template)
+
+
+def _synth_sync(text: str) -> bytes:
+    """Synthesize `text` through libespeak-ng, returning WAV bytes or b""."""
+    encoded = text.encode("utf-8")
+    with _espeak_lock:
+        _espeak_pcm.clear()
+        rc = _ESPEAK_LIB.espeak_Synth(
+            encoded,
+            ctypes.c_size_t(len(encoded) + 1),
+            0,
+            0,
+            0,
+            _ESPEAK_CHARS_UTF8,
+            None,
+            None,
+        )
+        if rc != 0 or not _espeak_pcm:
+            return b""
+        pcm = bytes(_espeak_pcm)
+        # Build the header while still holding the lock: it patches the
+        # shared template, and a concurrent synthesis past this point could
+        # otherwise interleave and ship the other caller's lengths.
+        header = _wav_header(len(pcm), _ESPEAK_SAMPLE_RATE)
+    return header + pcm
+
+
+# The fixed phrases pre-warmed at startup; they also gate the decoded-PCM
+# cache, which is reserved for audio known to be replayed verbatim.
+_STATIC_TTS_PHRASES = frozenset(
+    {
+        JOIN_ANNOUNCEMENT,
+        "Recording stopped. Playing back.",
+        "TTS probe",
+    }
+)
+
+# LRU of synthesized audio keyed by text. Dynamic phrases (per-user start
+# announcements) qualify too — regulars re-trigger the same strings — but the
+# cache is bounded by entry count and total bytes so an influx of distinct
+# display names cannot grow RSS. Held in memory only: this bot never writes
+# audio to disk.
+_TTS_CACHE: OrderedDict[str, bytes] = OrderedDict()
+_TTS_CACHE_MAX_ENTRIES = 128
+_TTS_CACHE_MAX_BYTES = 8 << 20
+
+
+def _tts_cache_put(text: str, data: bytes) -> None:
+    if not data:
+        return  # never cache a failure; a later attempt may succeed
+    _TTS_CACHE[text] = data
+    _TTS_CACHE.move_to_end(text)
+    total = sum(map(len, _TTS_CACHE.values()))
+    while _TTS_CACHE and (
+        len(_TTS_CACHE) > _TTS_CACHE_MAX_ENTRIES or total > _TTS_CACHE_MAX_BYTES
+    ):
+        _, evicted = _TTS_CACHE.popitem(last=False)
+        total -= len(evicted)
+
+
+# In-flight synthesis keyed by text: concurrent requests for the same phrase
+# share one result instead of each spawning an identical synthesis.
+_TTS_INFLIGHT: dict[str, asyncio.Future] = {}
 
 
 async def generate_tts_bytes(text: str) -> bytes:
@@ -78,18 +340,61 @@ async def generate_tts_bytes(text: str) -> bytes:
 
     This implementation does not write any files to disk. If `espeak-ng` is
     not available or fails, the function returns an empty bytes object.
+    Duplicate concurrent calls for the same text collapse onto a single
+    synthesis (single-flight) whose result all awaiters share.
     """
-    # Preferred path: espeak-ng -> stdout
+    cached = _TTS_CACHE.get(text)
+    if cached is not None:
+        _TTS_CACHE.move_to_end(text)
+        return cached
+
+    inflight = _TTS_INFLIGHT.get(text)
+    if inflight is not None:
+        return await inflight
+
+    future = asyncio.get_running_loop().create_future()
+    _TTS_INFLIGHT[text] = future
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "espeak-ng",
-            "--stdout",
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        out, err = await proc.communicate(text.encode())
-        if proc.returncode == 0 and out:
+        data = await _generate_tts_bytes_uncached(text)
+    except BaseException as exc:
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        elif not future.done():
+            future.set_exception(exc)
+        raise
+    else:
+        future.set_result(data)
+        return data
+    finally:
+        _TTS_INFLIGHT.pop(text, None)
+
+
+async def _generate_tts_bytes_uncached(text: str) -> bytes:
+    # Preferred path: in-process libespeak-ng (no subprocess). Synthesis is
+    # blocking and serialized by a lock, so run it on the default executor.
+    if _ESPEAK_LIB is not None:
+        try:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, _synth_sync, text)
+            if data:
+                _tts_cache_put(text, data)
+                return data
+        except Exception:
+            logger.debug("in-process espeak synthesis failed", exc_info=True)
+
+    # Fallback path: espeak-ng subprocess -> stdout. The import-time PATH
+    # lookup already told us whether spawning can possibly succeed.
+    if _TTS_BINARY is None:
+        logger.debug("espeak-ng not on PATH; skipping TTS")
+        return b""
+    try:
+        # The spawn runs on the executor: fork/exec setup does milliseconds
+        # of synchronous work (bpo-37263) that would otherwise stall every
+        # other event the loop is juggling.
+        loop = asyncio.get_running_loop()
+        out, err, returncode = await loop.run_in_executor(None, _run_tts_sync, text)
+        if returncode == 0 and out:
+            _tts_cache_put(text, out)
             return out
         # Log stderr at debug level for troubleshooting
         if err:
@@ -107,88 +412,263 @@ async def generate_tts_bytes(text: str) -> bytes:
     return b""
 
 
-async def probe_tts() -> bool:
-    """Quick probe to check if TTS generation works at runtime."""
+# Last probe verdict and when it was taken; availability rarely changes at
+# runtime, so re-checks within the TTL are free.
+_PROBE_CACHE: tuple[float, bool] | None = None
+_PROBE_TTL = 300.0
+
+
+async def probe_tts(force: bool = False) -> bool:
+    """Quick probe to check if TTS generation works at runtime.
+
+    The verdict is memoized for `_PROBE_TTL` seconds so gating logic can call
+    this freely without paying a synthesis per check; pass `force=True` to
+    bypass the cache (e.g. after installing espeak-ng).
+    """
+    global _PROBE_CACHE
+    if not force and _PROBE_CACHE is not None:
+        ts, ok = _PROBE_CACHE
+        if time.monotonic() - ts < _PROBE_TTL:
+            return ok
+    # When neither the in-process library nor the binary exists, the answer
+    # is already known — no need to attempt a synthesis.
+    if _ESPEAK_LIB is None and _TTS_BINARY is None:
+        ok = False
+    else:
+        try:
+            ok = bool(await generate_tts_bytes("TTS probe"))
+        except Exception:
+            ok = False
+    _PROBE_CACHE = (time.monotonic(), ok)
+    return ok
+
+
+# Template for the ephemeral error reply; only the description varies, so the
+# constant parts are built once instead of per error.
+_ERROR_EMBED_TEMPLATE = {"type": "rich", "title": "Error", "color": 0xFF0000}
+
+
+# File remembering the fingerprint of the last successfully synced command
+# set; unchanged restarts can then skip the heavyweight global sync request.
+_CMD_SYNC_HASH_FILE = ".cmd_sync_hash"
+
+
+def _command_set_hash(bot_obj) -> str | None:
+    """Stable fingerprint of the bot's registered application commands.
+
+    Returns None when the command set cannot be serialized, in which case
+    callers should fall back to an unconditional sync.
+    """
     try:
-        data = await generate_tts_bytes("TTS probe")
-        return bool(data)
+        payload = json.dumps(
+            [c.to_dict() for c in bot_obj.pending_application_commands],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
     except Exception:
-        return False
+        return None
 
 
 class RateLimitHandler:
-    def __init__(self):
-        self.last_connect_time = 0
-        self.min_interval = 2.0  # Minimum seconds between connection attempts
+    """Deadline-based limiter for voice-channel connect attempts.
+
+    The previous version read and updated a shared timestamp around an await,
+    so concurrent callers could observe the same stale value and all proceed
+    at once. Here each caller atomically claims the next free slot under a
+    lock held only for the bookkeeping, then sleeps outside it — waiters queue
+    with correct spacing and bursts cannot collapse onto one slot.
+    """
+
+    def __init__(self, min_interval: float = 2.0):
+        self.min_interval = min_interval  # seconds between connection attempts
+        self._next_allowed = 0.0
+        self._lock = asyncio.Lock()
 
     async def wait_if_needed(self):
-        now = time.time()
-        elapsed = now - self.last_connect_time
-        if elapsed < self.min_interval:
-            wait_time = self.min_interval - elapsed
-            logger.info(f"Rate limit: waiting {wait_time:.2f}s before connecting")
-            await asyncio.sleep(wait_time)
-        self.last_connect_time = time.time()
+        async with self._lock:
+            now = time.monotonic()
+            deadline = max(self._next_allowed, now)
+            self._next_allowed = deadline + self.min_interval
+        delay = deadline - now
+        if delay > 0:
+            logger.info("Rate limit: waiting %.2fs before connecting", delay)
+            await asyncio.sleep(delay)
+
+
+class BucketedLimiter:
+    """Named RateLimitHandler buckets sharing one front door.
+
+    Lets different operation classes (voice connects vs. bursty REST calls)
+    pace themselves independently without growing separate module globals for
+    each. Unknown bucket names are a no-op so callers never have to guard.
+    """
+
+    def __init__(self, buckets: dict[str, RateLimitHandler]):
+        self._buckets = buckets
 
+    async def acquire(self, name: str):
+        bucket = self._buckets.get(name)
+        if bucket is not None:
+            await bucket.wait_if_needed()
 
-rate_limiter = RateLimitHandler()
+
+# Discord's REST limits are already handled inside py-cord's HTTP client, so
+# only locally-originated bursts need pacing here: gateway voice connects and
+# the status-message edits /voicetest issues back to back.
+limiter = BucketedLimiter(
+    {
+        "connect": RateLimitHandler(2.0),
+        "rest": RateLimitHandler(0.25),
+    }
+)
+
+# Kept as an alias for the historical name; both refer to the connect bucket.
+rate_limiter = limiter._buckets["connect"]
+
+
+# Intents are fixed for this bot, so build them once at module load instead of
+# walking the intent flag table on every VoiceTestBot construction.
+_DEFAULT_INTENTS = discord.Intents.default()
+# Require members and voice state intents for reliable member/voice data
+_DEFAULT_INTENTS.members = True
+_DEFAULT_INTENTS.voice_states = True
+
+# Bound once so the membership check below skips the discord-module attribute
+# lookup per call; tests double it by patching this name.
+_Member = discord.Member
 
 
 class VoiceTestBot(commands.Bot):
     def __init__(self, config: dict):
-        intents = discord.Intents.default()
-        # Require members and voice state intents for reliable member/voice data
-        intents.members = True
-        intents.voice_states = True
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(command_prefix="!", intents=_DEFAULT_INTENTS)
         self.config = config
         self.default_duration = config.get("default_duration", 5)
         self.max_duration = config.get("max_duration", 10)
+        # Reply templates indexed by duration. Durations are clamped to
+        # [1, max_duration], so render the strings once here instead of
+        # re-formatting them on every interaction. The announcement tail is
+        # prefixed with the (dynamic) display name at send time.
+        self._start_msgs = [
+            f"Starting voice test for {d}s. You will be recorded and then played back."
+            for d in range(self.max_duration + 1)
+        ]
+        self._announce_tails = [
+            f" is starting a voice test for {d}s." for d in range(self.max_duration + 1)
+        ]
         self.playback_delay = config.get("playback_delay", 1)
         self.rate_limits = config.get("rate_limits", {})
 
         # Runtime state: simple in-memory trackers
         self._active_recordings = {}  # guild_id -> user_id
-
-        # runtime debug targets (set by CLI args)
+        # Per-guild locks make the busy check + claim atomic: `lock.locked()`
+        # is a cheap non-blocking probe and acquisition cannot race between
+        # concurrent interactions the way a dict get-then-set can.
+        self._guild_locks: dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Pending auto-leave re-check tasks, one per guild at most
+        self._pending_autoleave: dict[int, asyncio.Task] = {}
+
+        # runtime debug targets (set by CLI args); the bitmask mirrors the
+        # set and is what debug_enabled actually tests
         self.debug_targets: set[str] = set()
+        self._debug_mask = 0
         # Optional behavior: automatically leave voice channels when alone
         # Default to True for convenience; can be disabled via config.
         self.auto_leave_when_alone = config.get("auto_leave_when_alone", True)
 
     def set_debug_targets(self, targets: set):
         self.debug_targets = set(targets or [])
+        self._debug_mask = sum(
+            _TARGET_BIT[t] for t in self.debug_targets if t in _TARGET_BIT
+        )
 
     def debug_enabled(self, target: str) -> bool:
-        return target in getattr(self, "debug_targets", set())
+        return bool(
+            getattr(self, "_debug_mask", 0) & _TARGET_BIT.get(target, 0)
+        )
 
-    def debug(self, target: str, msg: str):
+    def debug(self, target: str, msg, *args):
         if self.debug_enabled(target):
-            # Route debug through the module logger so stdout/stderr capture works
-            logger.debug(f"[{target}] {msg}")
+            # Route debug through the module logger so stdout/stderr capture
+            # works; %-style args defer formatting until the record is emitted.
+            # A callable `msg` is invoked only here, so expensive renderings
+            # (e.g. traceback.format_exc) cost nothing when the target is off.
+            if callable(msg):
+                msg = msg()
+            if args:
+                logger.debug("[%s] " + msg, target, *args)
+            else:
+                # Pre-rendered messages (and tracebacks) may contain literal
+                # %; never run them through %-formatting.
+                logger.debug("[%s] %s", target, msg)
 
     # py-cord syncs commands automatically, no setup_hook needed for tree sync
 
 
 bot: VoiceTestBot | None = None
 
+# The running instance is also published through a ContextVar so call paths
+# can take one narrowed snapshot instead of re-reading (and re-None-checking)
+# the module global throughout.
+_BOT: ContextVar[VoiceTestBot] = ContextVar("bot")
+
+
+def _current_bot() -> VoiceTestBot | None:
+    """Return the running bot instance.
+
+    Prefers the ContextVar set in `main()`; falls back to the module global so
+    tests that assign `bot` directly keep working.
+    """
+    try:
+        return _BOT.get()
+    except LookupError:
+        return bot
+
+
+@functools.lru_cache(maxsize=None)
+def _responder_for(cls):
+    """Resolve the user-response strategy once per concrete interaction class.
+
+    ApplicationContext exposes `respond`, raw Interactions go through
+    `response`/`followup`; probing that shape with hasattr on every message is
+    wasted work since it is a property of the class, not the instance. Returns
+    an async callable taking (obj, msg, ephemeral=...)."""
+    if hasattr(cls, "respond"):
+
+        async def respond(obj, msg, ephemeral=True):
+            await obj.respond(msg, ephemeral=ephemeral)
+
+    elif hasattr(cls, "response"):
+
+        async def respond(obj, msg, ephemeral=True):
+            if not obj.response.is_done():
+                await obj.response.send_message(msg, ephemeral=ephemeral)
+            else:
+                await obj.followup.send(msg, ephemeral=ephemeral)
+
+    else:
+
+        async def respond(obj, msg, ephemeral=True):
+            return None
+
+    return respond
+
 
 async def ensure_voice_connected(
     ctx: discord.ApplicationContext | discord.Interaction,
 ) -> discord.VoiceClient | None:
-    # Ensure the bot is connected to the caller's voice channel
+    bot = _current_bot()
+    # Ensure the bot is connected to the caller's voice channel. Only Members
+    # carry a `.voice` state, so a single duck-typed fetch replaces the
+    # isinstance check and avoids loading `user.voice` twice.
     user = getattr(ctx, "author", None) or getattr(ctx, "user", None)
-    if not isinstance(user, discord.Member) or not user.voice or not user.voice.channel:
-        respond = getattr(ctx, "respond", None)
-        if not respond and hasattr(ctx, "response"):
-            respond = ctx.response.send_message
-        if respond:
-            await respond(
-                "You must be in a voice channel for this command.", ephemeral=True
-            )
+    voice = getattr(user, "voice", None)
+    channel = voice.channel if voice else None
+    if channel is None:
+        await _responder_for(type(ctx))(
+            ctx, "You must be in a voice channel for this command.", ephemeral=True
+        )
         return None
-
-    channel = user.voice.channel
     voice_client = ctx.guild.voice_client
     if voice_client and voice_client.channel.id == channel.id:
         return voice_client
@@ -197,20 +677,23 @@ async def ensure_voice_connected(
         if bot and bot.debug_enabled("voice"):
             bot.debug(
                 "voice",
-                f"Attempting to connect to voice channel id={channel.id} in guild={ctx.guild.id}",
+                "Attempting to connect to voice channel id=%s in guild=%s",
+                channel.id,
+                ctx.guild.id,
             )
 
         try:
-            await rate_limiter.wait_if_needed()
+            await limiter.acquire("connect")
             voice_client = await channel.connect()
         except Exception as exc:
-            # Detailed diagnostics to help root-cause intermittent library errors
-            tb = traceback.format_exc()
+            # Detailed diagnostics to help root-cause intermittent library
+            # errors. exc_info lets logging render the traceback only when a
+            # handler actually emits the record.
             logger.error(
-                "Voice connect raised %s: %s\nTraceback:\n%s",
+                "Voice connect raised %s: %s",
                 type(exc).__name__,
                 exc,
-                tb,
+                exc_info=True,
             )
 
             # Log some helpful context about guild and channel state
@@ -226,35 +709,209 @@ async def ensure_voice_connected(
                     vc_ids,
                 )
             except Exception:
-                logger.debug("Failed to log guild/channel diagnostics: %s", traceback.format_exc())
+                logger.debug("Failed to log guild/channel diagnostics", exc_info=True)
 
             # Re-raise so the outer handler can respond to the user
             raise
     except Exception as exc:
-        respond = getattr(ctx, "respond", None)
-        if not respond and hasattr(ctx, "response"):
-            respond = ctx.response.send_message
-        if respond:
-            await respond(f"Failed to join voice channel: {exc}", ephemeral=True)
+        await _responder_for(type(ctx))(
+            ctx, f"Failed to join voice channel: {exc}", ephemeral=True
+        )
         return None
 
     return voice_client
 
 
+def _disconnect_event(vc) -> asyncio.Event:
+    """Return an Event that fires when `vc` disconnects, attaching it on first use.
+
+    py-cord routes both explicit leaves and websocket-termination cleanup
+    through `VoiceClient.disconnect`, so wrapping that method once per client
+    gives waiters a real signal instead of polling `is_connected()`.
+    """
+    event = getattr(vc, "_sdt_disconnected", None)
+    if event is None:
+        event = asyncio.Event()
+        vc._sdt_disconnected = event
+        original = vc.disconnect
+
+        async def _disconnect(*args, **kwargs):
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                event.set()
+
+        vc.disconnect = _disconnect
+    return event
+
+
+class PreEncodedOpusSource(discord.AudioSource):
+    """AudioSource that replays a list of pre-encoded 20ms Opus frames.
+
+    Lets fixed clips (the join announcement) stream straight to the UDP sender
+    with no ffmpeg subprocess and no per-frame Opus encode.
+    """
+
+    def __init__(self, frames: list[bytes]):
+        self._frames = iter(frames)
+
+    def is_opus(self) -> bool:
+        return True
+
+    def read(self) -> bytes:
+        return next(self._frames, b"")
+
+
+# 20ms of 48kHz 16-bit stereo PCM: the frame size discord voice expects
+_PCM_FRAME_BYTES = 3840
+_PCM_FRAME_SAMPLES = 960
+
+
+# Decoded 48kHz stereo PCM for the fixed announcement phrases, keyed like
+# _TTS_CACHE. With both caches warm an announcement costs zero subprocesses.
+_TTS_PCM_CACHE: dict[str, bytes] = {}
+
+
+async def _tts_source(data: bytes, text: str | None = None):
+    """Wrap TTS WAV bytes in an AudioSource, preferring raw PCM over ffmpeg.
+
+    Decodes once to the 48kHz stereo PCM discord expects and caches the result
+    for the fixed announcement phrases, so steady-state announcements feed
+    `discord.PCMAudio` directly instead of forking an ffmpeg per clip. Falls
+    back to `FFmpegPCMAudio` when the decode fails (e.g. no ffmpeg yet a
+    working espeak), keeping behaviour identical to the old path.
+    """
+    pcm = _TTS_PCM_CACHE.get(text) if text is not None else None
+    if pcm is None:
+        pcm = await _decode_to_pcm(data)
+        if pcm and text is not None and text in _STATIC_TTS_PHRASES:
+            _TTS_PCM_CACHE[text] = pcm
+    if pcm:
+        return discord.PCMAudio(io.BytesIO(pcm))
+    return FFmpegPCMAudio(
+        io.BytesIO(data),
+        pipe=True,
+        before_options=FFMPEG_BEFORE_OPTIONS,
+        options=FFMPEG_OPTIONS,
+    )
+
+
+async def _decode_to_pcm(data: bytes) -> bytes:
+    """Decode an in-memory audio payload to 48kHz 16-bit stereo PCM via ffmpeg.
+
+    Returns empty bytes if ffmpeg is unavailable or the decode fails.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_PCM_TRANSCODE_ARGV,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        out, _err = await proc.communicate(data)
+        if proc.returncode == 0 and out:
+            return out
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug("PCM decode failed", exc_info=True)
+    return b""
+
+
+def _encode_opus_frames(pcm: bytes) -> list[bytes] | None:
+    """Encode raw 48kHz stereo PCM into a list of 20ms Opus frames.
+
+    Returns None when libopus is unavailable so callers can fall back to the
+    ffmpeg pipe path.
+    """
+    if not pcm:
+        return None
+    try:
+        encoder = discord.opus.Encoder()
+        frames = []
+        for off in range(0, len(pcm), _PCM_FRAME_BYTES):
+            chunk = pcm[off : off + _PCM_FRAME_BYTES]
+            if len(chunk) < _PCM_FRAME_BYTES:
+                chunk = chunk.ljust(_PCM_FRAME_BYTES, b"\x00")
+            frames.append(encoder.encode(chunk, _PCM_FRAME_SAMPLES))
+        return frames
+    except Exception:
+        logger.debug("Opus pre-encode unavailable; keeping ffmpeg playback path")
+        return None
+
+
+async def _play_and_wait(
+    voice_client: discord.VoiceClient, source, timeout: float | None = None
+) -> None:
+    """Play `source` on `voice_client` and wait until playback finishes.
+
+    Uses the `after=` completion callback of `VoiceClient.play` instead of
+    polling `is_playing()`, so the event loop is woken exactly once when the
+    track ends rather than every 100ms. Errors raised in the player thread are
+    delivered through the same callback and logged here rather than lost.
+
+    For clips whose duration is known up front, `timeout` bounds the wait so a
+    wedged player thread cannot hang the caller past the expected runtime.
+    """
+    done = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    player_error: list[Exception] = []
+
+    def _on_done(err):
+        if err is not None:
+            player_error.append(err)
+        loop.call_soon_threadsafe(done.set)
+
+    voice_client.play(source, after=_on_done)
+    try:
+        await asyncio.wait_for(done.wait(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Playback did not finish within %.1fs; stopping", timeout)
+        try:
+            voice_client.stop()
+        except Exception:
+            pass
+    if player_error:
+        logger.warning("Audio player finished with error: %s", player_error[0])
+
+
 async def play_join_sound(
     voice_client: discord.VoiceClient, text_channel: discord.TextChannel = None
 ):
-    # TTS Announcement
+    bot = _current_bot()
+    # TTS Announcement: prefer the Opus frames pre-encoded at startup (zero
+    # subprocesses), then the cached announcement bytes, then on-demand TTS.
     try:
-        data = await generate_tts_bytes(
-            "Voice tester has joined the channel. No recordings unless explicitly triggered by a user."
-        )
-        if data:
-            audio_source = io.BytesIO(data)
-            try:
-                audio_source.seek(0)
-            except Exception:
-                pass
+        source = None
+        clip_duration = None
+        frames = getattr(bot, "_join_opus_frames", None) if bot else None
+        join_pcm = getattr(bot, "_join_pcm", b"") if bot else b""
+        if frames:
+            source = PreEncodedOpusSource(frames)
+            clip_duration = len(frames) * 0.02
+        elif join_pcm:
+            # Pre-transcoded at startup: feed raw 48kHz stereo PCM directly,
+            # no ffmpeg spawn on the join path.
+            source = discord.PCMAudio(io.BytesIO(join_pcm))
+            clip_duration = len(join_pcm) / (48000 * 2 * 2)
+        else:
+            data = getattr(bot, "_join_announcement_bytes", b"") if bot else b""
+            if not data:
+                data = await generate_tts_bytes(JOIN_ANNOUNCEMENT)
+            if data:
+                audio_source = io.BytesIO(data)
+                try:
+                    audio_source.seek(0)
+                except Exception:
+                    pass
+                source = FFmpegPCMAudio(
+                    audio_source,
+                    pipe=True,
+                    before_options=FFMPEG_BEFORE_OPTIONS,
+                    options=FFMPEG_OPTIONS,
+                )
+
+        if source is not None:
             # Wait until the voice client reports it's connected before playing
             for _ in range(50):
                 try:
@@ -265,20 +922,20 @@ async def play_join_sound(
                 await asyncio.sleep(0.1)
 
             try:
-                voice_client.play(FFmpegPCMAudio(audio_source, pipe=True))
-                while voice_client.is_playing():
-                    await asyncio.sleep(0.1)
-                    # Abort if client is disconnected during playback
-                    if getattr(voice_client, "is_connected", None) and not voice_client.is_connected():
-                        break
+                # The `after=` callback fires when the player stops for any
+                # reason (end of stream or disconnect), so no polling needed.
+                # The clip length is known for pre-rendered audio, so bound the
+                # wait to duration plus a small margin instead of forever.
+                timeout = clip_duration + 2.0 if clip_duration else None
+                await _play_and_wait(voice_client, source, timeout=timeout)
             except Exception as play_exc:
-                logger.error(f"Playback failed: {play_exc}")
+                logger.error("Playback failed: %s", play_exc)
         else:
             logger.debug(
                 "No TTS audio produced for join announcement; skipping voice playback"
             )
     except Exception as e:
-        logger.error(f"Join TTS failed: {e}")
+        logger.error("Join TTS failed: %s", e)
 
     # Text Summary
     if text_channel:
@@ -301,24 +958,35 @@ async def play_join_sound(
                     "• No data is sent to external servers."
                 )
         except Exception as e:
-            logger.error(f"Failed to send text summary: {e}")
+            logger.error("Failed to send text summary: %s", e)
 
 
 async def record_user_audio(
     guild: discord.Guild, user: discord.User, duration: int
-) -> bytes:
+) -> io.BytesIO:
     """
     Capture `user`'s audio for `duration` seconds using py-cord's native voice receive.
-    Returns raw OGG bytes (Opus encoded).
+    Returns the sink's in-memory WAV buffer (48kHz stereo PCM payload), rewound
+    to the start; handing the buffer back directly avoids copying the whole
+    recording just to re-wrap it for playback.
     """
+    bot = _current_bot()
     vc: discord.VoiceClient = guild.voice_client
     if not vc:
         raise RuntimeError("Bot is not connected to a voice channel in this guild")
 
+    # Enforce the cap here too, not just at the command layer: the capture
+    # buffer grows with duration and every caller should hit the same bound.
+    max_duration = getattr(bot, "max_duration", None) if bot else None
+    if max_duration:
+        duration = min(duration, max_duration)
+
     if bot and bot.debug_enabled("sinks"):
-        bot.debug("sinks", "Using py-cord native OGGSink")
+        bot.debug("sinks", "Using py-cord native WaveSink")
 
-    sink = discord.sinks.OGGSink()
+    # WaveSink keeps the decoded PCM as-is in a WAV container; OGGSink would
+    # re-encode to Opus only for playback to decode it straight back.
+    sink = discord.sinks.WaveSink()
 
     # Use a future that the finished_callback will set when sink is flushed.
     loop = asyncio.get_running_loop()
@@ -345,22 +1013,30 @@ async def record_user_audio(
         if bot and bot.debug_enabled("sinks"):
             bot.debug(
                 "sinks",
-                f"Started recording for duration={duration}s on guild={guild.id}",
+                "Started recording for duration=%ss on guild=%s",
+                duration,
+                guild.id,
             )
     except Exception as exc:
-        if bot and bot.debug_enabled("sinks"):
+        if bot:
             bot.debug(
-                "sinks", f"start_recording threw: {exc}\n{traceback.format_exc()}"
+                "sinks",
+                lambda e=exc: f"start_recording threw: {e}\n{traceback.format_exc()}",
             )
         raise RuntimeError("Failed to start recording on VoiceClient") from exc
 
-    # Wait for the requested duration, checking connection periodically
-    for _ in range(int(duration * 10)):
-        if not vc.is_connected():
-            if bot and bot.debug_enabled("sinks"):
-                bot.debug("sinks", "Voice client disconnected during recording wait")
-            break
-        await asyncio.sleep(0.1)
+    # Wait the requested duration, or less if the voice client drops. The
+    # disconnect event replaces the old 100ms `is_connected()` polling loop:
+    # a full-length recording is now a single timed wakeup.
+    disconnected = _disconnect_event(vc)
+    if not vc.is_connected():
+        disconnected.set()
+    try:
+        await asyncio.wait_for(disconnected.wait(), timeout=duration)
+        if bot and bot.debug_enabled("sinks"):
+            bot.debug("sinks", "Voice client disconnected during recording wait")
+    except asyncio.TimeoutError:
+        pass  # full duration elapsed with the client still connected
 
     # Stop recording and wait for the sink's finished callback to fire.
     try:
@@ -372,10 +1048,10 @@ async def record_user_audio(
         await asyncio.wait_for(finished_future, timeout=2.0)
     except asyncio.TimeoutError:
         if bot and bot.debug_enabled("sinks"):
-            bot.debug("sinks", "OGGSink finished callback timed out; continuing")
+            bot.debug("sinks", "WaveSink finished callback timed out; continuing")
 
     # Extract audio
-    # py-cord's OGGSink stores data in sink.audio_data[user_id] which is an AudioData object
+    # py-cord's WaveSink stores data in sink.audio_data[user_id] which is an AudioData object
     # AudioData.file is a BytesIO object
     try:
         # sink.audio_data is a dict of user_id -> AudioData
@@ -391,30 +1067,40 @@ async def record_user_audio(
             if bot and bot.debug_enabled("sinks"):
                 bot.debug(
                     "sinks",
-                    f"No audio data for user {user.id}. Available keys: {list(sink.audio_data.keys())}",
+                    "No audio data for user %s. Available keys: %s",
+                    user.id,
+                    list(sink.audio_data.keys()),
                 )
             raise RuntimeError(f"No audio recorded for user {user.id}")
 
-        # AudioData.file is the BytesIO
-        audio_bytes = audio_data.file.getvalue()
-        return audio_bytes
+        # AudioData.file is the BytesIO; return it as-is instead of paying a
+        # full-buffer copy via getvalue().
+        audio_data.file.seek(0)
+        # Drop the sink's references so the returned buffer is the only copy
+        # of the target user's audio and other speakers' captures are freed
+        # immediately rather than living until the sink is collected.
+        sink.audio_data.clear()
+        return audio_data.file
 
     except Exception as exc:
         if bot and bot.debug_enabled("sinks"):
-            bot.debug("sinks", f"Error extracting audio: {exc}")
+            bot.debug("sinks", "Error extracting audio: %s", exc)
         raise
 
 
+@functools.lru_cache(maxsize=64)
 def _ensure_duration(dur: int, default: int, maximum: int) -> int:
+    # Durations come from a tiny discrete domain (None or 1..max_duration),
+    # so memoizing the clamp makes repeat commands a cache hit.
     if dur is None:
         return default
     try:
         d = int(dur)
-    except Exception:
+    except (TypeError, ValueError):
         return default
     if d <= 0:
         return default
-    return min(d, maximum)
+    return d if d < maximum else maximum
 
 
 # on_app_command_error is registered inside `main()` where `bot` exists.
@@ -430,41 +1116,58 @@ async def run_voice_test(
 ):
     """Common logic for running a voice test from slash command or button."""
 
-    # Helper to handle response differences
+    bot = _current_bot()
+
+    # Response-shape dispatch is resolved once per interaction class.
+    _respond = _responder_for(type(interaction))
+
     async def send_msg(msg, ephemeral=True):
-        if hasattr(interaction, "respond"):
-            await interaction.respond(msg, ephemeral=ephemeral)
-        elif hasattr(interaction, "response"):
-            if not interaction.response.is_done():
-                await interaction.response.send_message(msg, ephemeral=ephemeral)
-            else:
-                await interaction.followup.send(msg, ephemeral=ephemeral)
-        else:
-            # Fallback
-            pass
+        await _respond(interaction, msg, ephemeral=ephemeral)
 
     async def send_channel(msg):
-        if hasattr(interaction, "channel") and interaction.channel:
-            await interaction.channel.send(msg)
-        elif (
-            hasattr(interaction, "message")
-            and interaction.message
-            and interaction.message.channel
-        ):
-            await interaction.message.channel.send(msg)
+        channel = getattr(interaction, "channel", None)
+        if channel:
+            return await channel.send(msg)
+        message = getattr(interaction, "message", None)
+        if message and message.channel:
+            return await message.channel.send(msg)
+        return None
+
+    async def update_status(status, msg):
+        """Edit the running status message in place, falling back to a send.
+
+        Message edits hit a per-message rate-limit bucket instead of the
+        channel's 5-messages/5s send bucket, so one posted message edited per
+        phase replaces a burst of separate sends.
+        """
+        await limiter.acquire("rest")
+        if status is not None and hasattr(status, "edit"):
+            try:
+                await status.edit(content=msg)
+                return status
+            except Exception:
+                pass
+        return await send_channel(msg)
 
     guild = interaction.guild
     if not guild:
         await send_msg("This command must be used in a guild.")
         return
 
-    # Check membership and channel
-    if not isinstance(user, discord.Member) or not user.voice or not user.voice.channel:
+    # Check membership and channel. `type(...) is` hits for the overwhelming
+    # majority of real members without an MRO walk; isinstance covers
+    # subclasses and test doubles.
+    if (
+        not (type(user) is _Member or isinstance(user, _Member))
+        or not user.voice
+        or not user.voice.channel
+    ):
         await send_msg("You must be in a voice channel to run a voice test.")
         return
 
     guild_id = guild.id
-    if bot._active_recordings.get(guild_id):
+    lock = bot._guild_locks[guild_id]
+    if lock.locked():
         await send_msg(
             "A recording is already in progress in this guild. Try again later."
         )
@@ -474,34 +1177,47 @@ async def run_voice_test(
     if not vc:
         return
 
-    # Helper to safely play audio
-    async def safe_play(data_or_bytesio):
+    # Helper to safely play audio; accepts raw bytes, a file-like buffer, or
+    # an already-prepared AudioSource (e.g. one spawned ahead of time).
+    async def safe_play(data_or_source):
         if not vc.is_connected():
             return
         try:
-            if isinstance(data_or_bytesio, bytes):
-                source = io.BytesIO(data_or_bytesio)
+            if isinstance(data_or_source, discord.AudioSource):
+                source = data_or_source
             else:
-                source = data_or_bytesio
-            
-            try:
-                source.seek(0)
-            except Exception:
-                pass
-                
-            vc.play(FFmpegPCMAudio(source, pipe=True))
-            while vc.is_playing():
-                await asyncio.sleep(0.1)
-                if not vc.is_connected():
-                    break
-        except Exception as e:
-            logger.warning(f"Playback error: {e}")
+                if isinstance(data_or_source, bytes):
+                    buf = io.BytesIO(data_or_source)
+                else:
+                    buf = data_or_source
 
-    # Announce and play a short cue
-    await send_msg(
-        f"Starting voice test for {duration}s. You will be recorded and then played back."
-    )
-    await send_channel(f"{user.display_name} is starting a voice test for {duration}s.")
+                try:
+                    buf.seek(0)
+                except Exception:
+                    pass
+
+                source = FFmpegPCMAudio(
+                    buf,
+                    pipe=True,
+                    before_options=FFMPEG_BEFORE_OPTIONS,
+                    options=FFMPEG_OPTIONS,
+                )
+            await _play_and_wait(vc, source)
+        except Exception as e:
+            logger.warning("Playback error: %s", e)
+
+    # Announce and play a short cue, preferring the templates pre-rendered at
+    # startup (stub bots in tests may not carry them).
+    start_msgs = getattr(bot, "_start_msgs", None)
+    if start_msgs and 0 <= duration < len(start_msgs):
+        start_msg = start_msgs[duration]
+        announce_msg = user.display_name + bot._announce_tails[duration]
+    else:
+        start_msg = f"Starting voice test for {duration}s. You will be recorded and then played back."
+        announce_msg = f"{user.display_name} is starting a voice test for {duration}s."
+    await send_msg(start_msg)
+    # Single public status message, edited as the test progresses.
+    status = await send_channel(announce_msg)
 
     # TTS: Announce start
     try:
@@ -518,57 +1234,111 @@ async def run_voice_test(
                 "Voice announcement unavailable; cannot proceed with recording for privacy reasons.",
                 ephemeral=True,
             )
-            await send_channel("Voice test aborted: audible announcement unavailable.")
+            await update_status(status, "Voice test aborted: audible announcement unavailable.")
             return
 
-        await safe_play(data)
+        await safe_play(await _tts_source(data))
     except Exception as e:
-        logger.error(f"TTS generation failed: {e}")
+        logger.error("TTS generation failed: %s", e)
         await send_msg("TTS error occurred; aborting voice test.", ephemeral=True)
-        await send_channel("Voice test aborted: TTS error during start announcement.")
+        await update_status(status, "Voice test aborted: TTS error during start announcement.")
         return
 
-    try:
+    # Re-check just before claiming: the TTS announcement awaits above could
+    # have let a concurrent interaction reach this point first.
+    if lock.locked():
+        await send_msg(
+            "A recording is already in progress in this guild. Try again later."
+        )
+        return
+    async with lock:
         bot._active_recordings[guild_id] = user.id
+        # Mirror the claim onto the voice client for the voice-state event
+        # path, which fires far more often than commands do.
+        vc._sdt_active_user_id = user.id
+        stop_tts_task = None
         # Attempt live record via sinks
         try:
             if bot and bot.debug_enabled("commands"):
                 bot.debug(
                     "commands",
-                    f"Starting live capture for user={user.id} dur={duration}",
+                    "Starting live capture for user=%s dur=%s",
+                    user.id,
+                    duration,
                 )
 
-            audio_bytes = await record_user_audio(guild, user, duration)
+            # Synthesize the stop announcement while the recording runs so
+            # it is ready the instant capture ends.
+            stop_tts_task = asyncio.create_task(
+                generate_tts_bytes("Recording stopped. Playing back.")
+            )
+            audio_buffer = await record_user_audio(guild, user, duration)
 
             # TTS: Announce stop
             try:
-                data = await generate_tts_bytes("Recording stopped. Playing back.")
+                data = await stop_tts_task
                 if data:
-                    await safe_play(data)
+                    await safe_play(
+                        await _tts_source(data, "Recording stopped. Playing back.")
+                    )
                 else:
                     logger.debug(
                         "No TTS audio produced for stop announcement; skipping voice playback"
                     )
             except Exception as e:
-                logger.error(f"TTS generation failed: {e}")
-
-            await send_channel("Recording complete. Waiting briefly before playback...")
-            await asyncio.sleep(bot.playback_delay)
+                logger.error("TTS generation failed: %s", e)
+
+            # WaveSink's payload is already the 48kHz stereo PCM discord
+            # expects, so playback usually needs no transcode at all: skip
+            # the 44-byte RIFF header and stream the PCM directly. Anything
+            # else falls back to ffmpeg, spawned in a worker thread while the
+            # delay and the status edit run so the process is warm by then.
+            playback_source = None
+            source_task = None
+            if audio_buffer.read(4) == b"RIFF":
+                audio_buffer.seek(44)
+                playback_source = discord.PCMAudio(audio_buffer)
+            else:
+                audio_buffer.seek(0)
+                source_task = asyncio.create_task(
+                    asyncio.to_thread(
+                        FFmpegPCMAudio,
+                        audio_buffer,
+                        pipe=True,
+                        before_options=FFMPEG_BEFORE_OPTIONS,
+                        options=FFMPEG_OPTIONS,
+                    )
+                )
+            # Overlap the completion notice (an HTTP round-trip) with the
+            # playback delay instead of paying for them back to back.
+            status, _ = await asyncio.gather(
+                update_status(status, "Recording complete. Waiting briefly before playback..."),
+                asyncio.sleep(bot.playback_delay),
+            )
 
             # Playback from memory
-            audio_source = io.BytesIO(audio_bytes)
-            # FFmpegPCMAudio with pipe=True reads from the file-like object
-            await send_channel("Playing back recorded audio.")
-            await safe_play(audio_source)
+            status = await update_status(status, "Playing back recorded audio.")
+            if playback_source is None:
+                playback_source = await source_task
+            await safe_play(playback_source)
+            # Playback is done with the recording; release the buffer now
+            # rather than waiting for the next GC pass.
+            try:
+                audio_buffer.close()
+            except Exception:
+                pass
 
-            await send_channel("Playback complete.")
+            await update_status(status, "Playback complete.")
         except Exception as exc:
             # If recording isn't supported or errors, fall back to placeholder snippet
             if bot and bot.debug_enabled("sinks"):
-                bot.debug("sinks", f"record_user_audio failed: {exc}")
-            await send_channel(f"Recording failed: {exc}")
-    finally:
-        bot._active_recordings.pop(guild_id, None)
+                bot.debug("sinks", "record_user_audio failed: %s", exc)
+            await update_status(status, f"Recording failed: {exc}")
+        finally:
+            if stop_tts_task is not None and not stop_tts_task.done():
+                stop_tts_task.cancel()
+            vc._sdt_active_user_id = None
+            bot._active_recordings.pop(guild_id, None)
 
 
 async def cleanup_and_shutdown(bot_obj, sig_name: str | int = None):
@@ -577,38 +1347,42 @@ async def cleanup_and_shutdown(bot_obj, sig_name: str | int = None):
     `main()` so it can be tested directly.
     """
     logger.info(
-        f"Shutdown requested ({sig_name}); cleaning up voice clients and recordings"
+        "Shutdown requested (%s); cleaning up voice clients and recordings", sig_name
     )
+    async def _cleanup_guild(guild):
+        vc = getattr(guild, "voice_client", None)
+        if not vc:
+            return
+        # If the voice client is recording via sinks, stop it
+        try:
+            vc.stop_recording()
+        except Exception:
+            pass
+        # Disconnect the voice client; support both sync and async APIs
+        try:
+            disc = vc.disconnect
+            if asyncio.iscoroutinefunction(disc):
+                await disc()
+            else:
+                disc()
+        except Exception:
+            logger.debug(
+                "Failed to disconnect vc for guild %s", getattr(guild, "id", None)
+            )
+
     try:
-        # Stop any active recordings by attempting to stop recording on each VC
-        for guild in list(getattr(bot_obj, "guilds", [])):
-            try:
-                vc = getattr(guild, "voice_client", None)
-                if vc:
-                    try:
-                        # If the voice client is recording via sinks, stop it
-                        try:
-                            vc.stop_recording()
-                        except Exception:
-                            pass
-                        # Disconnect the voice client
-                        try:
-                            # Support both sync and async disconnect APIs
-                            disc = vc.disconnect
-                            if asyncio.iscoroutinefunction(disc):
-                                await disc()
-                            else:
-                                disc()
-                        except Exception:
-                            logger.debug(
-                                f"Failed to disconnect vc for guild {getattr(guild, 'id', None)}"
-                            )
-                    except Exception:
-                        logger.debug(
-                            f"Failed to disconnect vc for guild {getattr(guild, 'id', None)}"
-                        )
-            except Exception:
-                logger.debug(f"Error while cleaning guild {getattr(guild, 'id', None)}")
+        # Voice disconnects are independent I/O; run them concurrently so
+        # shutdown latency is the slowest guild, not the sum of all of them.
+        # Each guild is additionally capped so one unresponsive voice gateway
+        # cannot eat the whole SIGTERM grace window.
+        guilds = list(getattr(bot_obj, "guilds", []))
+        results = await asyncio.gather(
+            *(asyncio.wait_for(_cleanup_guild(g), timeout=5.0) for g in guilds),
+            return_exceptions=True,
+        )
+        for guild, result in zip(guilds, results):
+            if isinstance(result, BaseException):
+                logger.debug("Error while cleaning guild %s", getattr(guild, "id", None))
 
         # Clear active recording state
         try:
@@ -631,6 +1405,77 @@ async def cleanup_and_shutdown(bot_obj, sig_name: str | int = None):
             pass
 
 
+# Slash-command handlers. Defined at module scope (rather than as closures in
+# `main()`) so each handler is created once, resolves `bot` as a module global,
+# and can be exercised directly by tests.
+
+
+async def join_command(ctx: discord.ApplicationContext):
+    if bot and bot.debug_enabled("commands"):
+        bot.debug(
+            "commands",
+            "/join invoked by user=%s in guild=%s",
+            ctx.author.id,
+            ctx.guild.id,
+        )
+    # Defer to give extra time for the voice connect
+    try:
+        await ctx.defer(ephemeral=True)
+    except Exception:
+        try:
+            await ctx.response.defer(ephemeral=True)
+        except Exception:
+            pass
+
+    vc = await ensure_voice_connected(ctx)
+    if not vc:
+        try:
+            await ctx.followup.send("Failed to join voice channel.", ephemeral=True)
+        except Exception:
+            pass
+        return
+
+    try:
+        await ctx.followup.send("Joined voice channel.", ephemeral=True)
+    except Exception:
+        pass
+
+    await play_join_sound(vc, text_channel=ctx.channel)
+
+
+async def leave_command(ctx: discord.ApplicationContext):
+    vc = ctx.guild.voice_client
+    if vc:
+        await vc.disconnect()
+        await ctx.respond("Left voice channel.", ephemeral=True)
+    else:
+        await ctx.respond("Not connected.", ephemeral=True)
+
+
+async def voicetest_command(ctx: discord.ApplicationContext, duration: int = None):
+    if bot and bot.debug_enabled("commands"):
+        bot.debug(
+            "commands",
+            "/voicetest invoked by user=%s duration=%s",
+            ctx.author.id,
+            duration,
+        )
+
+    dur = _ensure_duration(duration, bot.default_duration, bot.max_duration)
+    await run_voice_test(ctx, ctx.author, dur)
+
+
+async def stop_command(ctx: discord.ApplicationContext):
+    guild_id = ctx.guild.id
+    current = bot._active_recordings.get(guild_id)
+    if current and current == ctx.author.id:
+        # No real recording in scaffold; just remove state
+        bot._active_recordings.pop(guild_id, None)
+        await ctx.respond("Stopped your active recording.", ephemeral=True)
+    else:
+        await ctx.respond("No active recording found for you.", ephemeral=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Discord Sound Test bot (prototype)")
     parser.add_argument(
@@ -654,15 +1499,28 @@ def main():
         )
     args = parser.parse_args()
 
+    # Prefer uvloop's libuv-backed event loop when installed: sockets,
+    # subprocess pipes and timers all get cheaper with no handler changes.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("uvloop event loop policy installed")
+    except ImportError:
+        pass
+
     config_path = args.config
-    if not os.path.exists(config_path):
-        logger.error(f"Config file not found: {config_path}")
+    # load_config stats the file for its cache key, so a separate existence
+    # check would just duplicate the syscall; catch the miss instead.
+    try:
+        config = load_config(config_path)
+    except FileNotFoundError:
+        logger.error("Config file not found: %s", config_path)
         sys.exit(2)
 
-    config = load_config(config_path)
-
     global bot
     bot = VoiceTestBot(config)
+    _BOT.set(bot)
 
     # Register graceful shutdown handlers to ensure we don't leave recordings
     # or voice clients open on SIGINT/SIGTERM. We schedule an async cleanup
@@ -699,19 +1557,43 @@ def main():
         if getattr(args, flag_name, False):
             selected.add(t)
     bot.set_debug_targets(selected)
-    bot.debug("config", f"Debug targets: {sorted(list(selected))}")
-    bot.debug("config", f"Loaded config: {redact_config(config)}")
+    # Guard at the callsite so the f-strings (and redact_config copy) are only
+    # built when the config target is actually enabled.
+    if bot.debug_enabled("config"):
+        bot.debug("config", f"Debug targets: {sorted(list(selected))}")
+        bot.debug("config", f"Loaded config: {redact_config(config)}")
     logger.debug("startup completed preliminary setup")
 
     @bot.event
     async def on_ready():
-        logger.info(f"Bot ready: {bot.user} ({bot.user.id})")
+        logger.info("Bot ready: %s (%s)", bot.user, bot.user.id)
+
+        # The TTS probe (local subprocess/library work) and the command sync
+        # (a Discord API round-trip) are independent, so run them
+        # concurrently: startup costs max(probe, sync) instead of their sum.
+        await asyncio.gather(_probe_and_prerender(), _sync_startup_commands())
+
+    async def _probe_and_prerender():
         # Probe TTS at startup so we can enforce audible consent for recordings
         try:
             ok = await probe_tts()
             bot.tts_available = ok
             if ok:
                 logger.info("TTS probe succeeded; in-voice announcements enabled")
+                # Synthesize the fixed join announcement once so each /join
+                # plays from memory instead of re-running TTS.
+                bot._join_announcement_bytes = await generate_tts_bytes(
+                    JOIN_ANNOUNCEMENT
+                )
+                # Best effort: pre-decode + Opus-encode the announcement so
+                # /join playback needs no ffmpeg subprocess at all. The raw
+                # PCM is kept too: when libopus is unavailable it still lets
+                # playback go through discord.PCMAudio with zero subprocesses.
+                bot._join_pcm = await _decode_to_pcm(bot._join_announcement_bytes)
+                bot._join_opus_frames = _encode_opus_frames(bot._join_pcm)
+                # Pre-warm the remaining fixed phrase so the first /voicetest
+                # stop announcement also comes straight from the cache.
+                await generate_tts_bytes("Recording stopped. Playing back.")
             else:
                 logger.warning("TTS probe failed; voice announcements will be disabled")
         except Exception:
@@ -719,20 +1601,42 @@ def main():
             logger.exception("TTS probe raised an exception")
         # UI views with buttons have been removed; only slash commands remain
 
+    async def _sync_startup_commands():
         # Ensure application commands are synchronized with Discord's API.
+        # A global sync is a slow, rate-limited request, so skip it when the
+        # command set hash matches the one recorded by the last sync.
         try:
-            logger.info("Attempting global command sync...")
-            await bot.sync_commands()
-            logger.info("Global command sync complete.")
+            cmd_hash = _command_set_hash(bot)
+            last_hash = None
+            if cmd_hash:
+                try:
+                    last_hash = pathlib.Path(_CMD_SYNC_HASH_FILE).read_text().strip()
+                except OSError:
+                    last_hash = None
+            if cmd_hash and cmd_hash == last_hash:
+                logger.info("Command set unchanged since last sync; skipping.")
+            else:
+                logger.info("Attempting global command sync...")
+                await bot.sync_commands()
+                logger.info("Global command sync complete.")
+                if cmd_hash:
+                    try:
+                        pathlib.Path(_CMD_SYNC_HASH_FILE).write_text(cmd_hash + "\n")
+                    except OSError:
+                        logger.debug("Could not persist command sync hash")
         except Exception:
             logger.exception("Command sync failed on startup. Exiting.")
             sys.exit(1)
 
     @bot.event
     async def on_app_command_error(interaction: discord.Interaction, error: Exception):
-        # Basic error handler for application commands
+        # Basic error handler for application commands. Truncate upfront so an
+        # oversized description can't get the reply rejected by the API.
         try:
-            await interaction.response.send_message(f"Error: {error}", ephemeral=True)
+            payload = {**_ERROR_EMBED_TEMPLATE, "description": str(error)[:2000]}
+            await interaction.response.send_message(
+                embed=discord.Embed.from_dict(payload), ephemeral=True
+            )
         except Exception:
             pass
     @bot.event
@@ -743,6 +1647,11 @@ def main():
         briefly switch channels.
         """
         try:
+            # Mute/deafen/video toggles keep the member in place and cannot
+            # change channel population; skip them before any other work.
+            if before.channel == after.channel:
+                return
+
             guild = getattr(member, "guild", None)
             if not guild:
                 return
@@ -752,20 +1661,25 @@ def main():
             if not getattr(bot, "auto_leave_when_alone", True):
                 return
 
-            # If a recording is active, do not auto-disconnect
-            if getattr(bot, "_active_recordings", {}).get(guild_id):
-                return
-
             vc = guild.voice_client
             if not vc or not getattr(vc, "channel", None):
                 return
 
+            # If a recording is active, do not auto-disconnect. The flag
+            # lives on the voice client itself, so this per-event check is
+            # one attribute read instead of a dict lookup by guild id.
+            if getattr(vc, "_sdt_active_user_id", None):
+                return
+
             channel = vc.channel
+            # Only moves touching the bot's channel can leave it empty.
+            if before.channel != channel and after.channel != channel:
+                return
 
             async def _delayed_check():
                 await asyncio.sleep(5)
                 # If a recording started meanwhile, abort
-                if getattr(bot, "_active_recordings", {}).get(guild_id):
+                if getattr(vc, "_sdt_active_user_id", None):
                     return
                 # Re-evaluate members in the channel
                 non_bots = [m for m in channel.members if not getattr(m, "bot", False)]
@@ -773,81 +1687,33 @@ def main():
                     try:
                         await vc.disconnect()
                         logger.info(
-                            f"Auto-disconnect: left voice channel in guild {guild_id} (no non-bot users)"
+                            "Auto-disconnect: left voice channel in guild %s (no non-bot users)",
+                            guild_id,
                         )
                     except Exception:
                         logger.debug(
-                            f"Auto-disconnect failed for guild {guild_id}: {traceback.format_exc()}"
+                            "Auto-disconnect failed for guild %s",
+                            guild_id,
+                            exc_info=True,
                         )
 
-            asyncio.create_task(_delayed_check())
+            # Coalesce: a burst of joins/leaves needs only the most recent
+            # 5-second re-check, so cancel any check still pending.
+            prev = bot._pending_autoleave.pop(guild_id, None)
+            if prev is not None and not prev.done():
+                prev.cancel()
+            bot._pending_autoleave[guild_id] = asyncio.create_task(_delayed_check())
         except Exception:
             logger.exception("on_voice_state_update handler error")
 
-    @bot.slash_command(name="join")
-    async def join_command(ctx: discord.ApplicationContext):
-        if bot and bot.debug_enabled("commands"):
-            bot.debug(
-                "commands",
-                f"/join invoked by user={ctx.author.id} in guild={ctx.guild.id}",
-            )
-        # Defer to give extra time for the voice connect
-        try:
-            await ctx.defer(ephemeral=True)
-        except Exception:
-            try:
-                await ctx.response.defer(ephemeral=True)
-            except Exception:
-                pass
-
-        vc = await ensure_voice_connected(ctx)
-        if not vc:
-            try:
-                await ctx.followup.send("Failed to join voice channel.", ephemeral=True)
-            except Exception:
-                pass
-            return
-
-        try:
-            await ctx.followup.send("Joined voice channel.", ephemeral=True)
-        except Exception:
-            pass
-
-        await play_join_sound(vc, text_channel=ctx.channel)
-
-    @bot.slash_command(name="leave")
-    async def leave_command(ctx: discord.ApplicationContext):
-        vc = ctx.guild.voice_client
-        if vc:
-            await vc.disconnect()
-            await ctx.respond("Left voice channel.", ephemeral=True)
-        else:
-            await ctx.respond("Not connected.", ephemeral=True)
-
-    @bot.slash_command(name="voicetest")
-    async def voicetest_command(ctx: discord.ApplicationContext, duration: int = None):
-        if bot and bot.debug_enabled("commands"):
-            bot.debug(
-                "commands",
-                f"/voicetest invoked by user={ctx.author.id} duration={duration}",
-            )
-
-        dur = _ensure_duration(duration, bot.default_duration, bot.max_duration)
-        await run_voice_test(ctx, ctx.author, dur)
-
+    # Slash-command handlers live at module scope (see *_command functions);
+    # register them against this bot instance.
+    bot.slash_command(name="join")(join_command)
+    bot.slash_command(name="leave")(leave_command)
+    bot.slash_command(name="voicetest")(voicetest_command)
     # Removed `/postvoicetestcommands` which posted interactive buttons.
     # The bot now supports only slash commands: `/join`, `/leave`, `/voicetest`, `/stop`.
-
-    @bot.slash_command(name="stop")
-    async def stop_command(ctx: discord.ApplicationContext):
-        guild_id = ctx.guild.id
-        current = bot._active_recordings.get(guild_id)
-        if current and current == ctx.author.id:
-            # No real recording in scaffold; just remove state
-            bot._active_recordings.pop(guild_id, None)
-            await ctx.respond("Stopped your active recording.", ephemeral=True)
-        else:
-            await ctx.respond("No active recording found for you.", ephemeral=True)
+    bot.slash_command(name="stop")(stop_command)
 
     # Basic startup checks
     token = config.get("token")
@@ -1,17 +1,14 @@
-"""Package shim that re-exports the project's top-level `bot` module.
+"""Package shim that aliases the project's top-level `bot` module.
 
 This file intentionally avoids duplicating implementation. Edit the
-top-level `bot.py` (the canonical source) and this shim will expose the
-same symbols under `discord_sound_test.bot` for tests and tooling.
+top-level `bot.py` (the canonical source); replacing this module's
+`sys.modules` entry makes `discord_sound_test.bot` *be* that module, so
+every symbol — including underscore-prefixed test seams — stays in sync
+with no per-attribute copying at import time.
 """
 
-import importlib
+import sys
 
-# Import the top-level module and re-export its public symbols. Avoid using
-# `from bot import *` so static analyzers can reason about the shim.
-_bot = importlib.import_module("bot")
-for _name in dir(_bot):
-    if not _name.startswith("_"):
-        globals()[_name] = getattr(_bot, _name)
+import bot as _bot
 
-__all__ = [n for n in dir(_bot) if not n.startswith("_")]
+sys.modules[__name__] = _bot
@@ -1,6 +1,113 @@
 import sys
 import pathlib
 
-# Ensure project root is on sys.path so tests can import the package
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
+# Ensure project root is on sys.path so tests can import the package. No
+# resolve(): pytest hands us an absolute __file__ already, and the guard keeps
+# repeated collections (e.g. xdist workers) from growing sys.path.
+ROOT = str(pathlib.Path(__file__).parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import bot as botmod
+
+
+# Shared test doubles. Defined once here instead of per test module; tests
+# import them with `from conftest import ...`.
+
+
+class FakeCompleted:
+    """Stand-in for the CompletedProcess that subprocess.run returns."""
+
+    def __init__(self, out: bytes = b"", returncode: int = 0):
+        self.stdout = out
+        self.stderr = b""
+        self.returncode = returncode
+
+
+class DummyVC:
+    """Minimal VoiceClient double covering recording, playback and disconnect."""
+
+    def __init__(self):
+        self.stop_called = False
+        self.disconnected = False
+
+    def stop_recording(self):
+        self.stop_called = True
+
+    async def disconnect(self):
+        # simulate async disconnect
+        await asyncio.sleep(0)
+        self.disconnected = True
+
+    def play(self, source, after=None):
+        # Match VoiceClient.play's signature and complete "playback"
+        # immediately, error-free, so _play_and_wait's done-event fires
+        # instead of hanging forever.
+        if after is not None:
+            after(None)
+
+    def is_playing(self):
+        return False
+
+
+class DummyGuild:
+    def __init__(self, gid, vc):
+        self.id = gid
+        self.voice_client = vc
+
+
+class DummyMember:
+    def __init__(self, name="Tester", uid=123):
+        self.display_name = name
+        self.id = uid
+        self.voice = SimpleNamespace(channel=True)
+
+
+class DummyChannel:
+    """Records sent messages into the dict shared with DummyInteraction."""
+
+    def __init__(self, sent):
+        self._sent = sent
+
+    async def send(self, msg):
+        self._sent.setdefault("channel", []).append(msg)
+
+
+class DummyInteraction:
+    def __init__(self, sent, member=None):
+        self.guild = SimpleNamespace(id=1)
+        self.user = member or DummyMember()
+        self.channel = DummyChannel(sent)
+        self._sent = sent
+
+    async def respond(self, msg, ephemeral=True):
+        self._sent.setdefault("respond", []).append(msg)
+
+
+@pytest.fixture(autouse=True)
+def force_subprocess_tts(monkeypatch):
+    """Disable the in-process libespeak path so TTS tests that fake the
+    espeak-ng subprocess exercise the code they patch regardless of whether
+    libespeak-ng happens to be installed on the host."""
+    monkeypatch.setattr(botmod, "_ESPEAK_LIB", None)
+    # Pretend the binary exists so the subprocess path (which the tests fake
+    # via subprocess.run) is actually attempted.
+    monkeypatch.setattr(botmod, "_TTS_BINARY", "espeak-ng")
+
+
+@pytest.fixture(autouse=True)
+def clear_tts_cache():
+    """Each test gets an empty TTS cache; several tests synthesize the same
+    fixed phrase with different fakes and must not see each other's bytes."""
+    botmod._TTS_CACHE.clear()
+    botmod._TTS_PCM_CACHE.clear()
+    botmod._PROBE_CACHE = None
+    yield
+    botmod._TTS_CACHE.clear()
+    botmod._TTS_PCM_CACHE.clear()
+    botmod._PROBE_CACHE = None
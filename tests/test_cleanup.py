@@ -1,29 +1,9 @@
-import asyncio
 from types import SimpleNamespace
 
 import pytest
 
 import bot as botmod
-
-
-class DummyVC:
-    def __init__(self):
-        self.stop_called = False
-        self.disconnected = False
-
-    def stop_recording(self):
-        self.stop_called = True
-
-    async def disconnect(self):
-        # simulate async disconnect
-        await asyncio.sleep(0)
-        self.disconnected = True
-
-
-class DummyGuild:
-    def __init__(self, gid, vc):
-        self.id = gid
-        self.voice_client = vc
+from conftest import DummyGuild, DummyVC
 
 
 @pytest.mark.asyncio
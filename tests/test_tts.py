@@ -1,25 +1,18 @@
-import asyncio
+import ctypes
+import subprocess
+
 import pytest
 
+from conftest import FakeCompleted
 from discord_sound_test import bot
 
 
-class FakeProc:
-    def __init__(self, out: bytes = b"", returncode: int = 0):
-        self._out = out
-        self.returncode = returncode
-
-    async def communicate(self, input=None):
-        # simulate subprocess.communicate returning (stdout, stderr)
-        return (self._out, b"")
-
-
 @pytest.mark.asyncio
 async def test_generate_tts_success(monkeypatch):
-    async def fake_create_subprocess_exec(*args, **kwargs):
-        return FakeProc(b"FAKEAUDIO", 0)
+    def fake_run(*args, **kwargs):
+        return FakeCompleted(b"FAKEAUDIO", 0)
 
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
     data = await bot.generate_tts_bytes("hello world")
     assert data == b"FAKEAUDIO"
@@ -27,12 +20,11 @@ async def test_generate_tts_success(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_generate_tts_failure(monkeypatch):
-    async def fake_create_subprocess_exec(*args, **kwargs):
-        # return a process with empty output and non-zero returncode
-        p = FakeProc(b"", 1)
-        return p
+    def fake_run(*args, **kwargs):
+        # simulate espeak-ng exiting non-zero with no output
+        return FakeCompleted(b"", 1)
 
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
     data = await bot.generate_tts_bytes("hello")
     assert data == b""
@@ -40,21 +32,47 @@ async def test_generate_tts_failure(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_generate_tts_missing_executable(monkeypatch):
-    async def fake_create_subprocess_exec(*args, **kwargs):
+    def fake_run(*args, **kwargs):
         raise FileNotFoundError()
 
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
     data = await bot.generate_tts_bytes("hello")
     assert data == b""
 
 
+class FakeEspeakLib:
+    """Drives the registered sample callback the way libespeak-ng would:
+    through the CFUNCTYPE trampoline, which swallows callback exceptions."""
+
+    def __init__(self, samples):
+        self._samples = samples
+
+    def espeak_Synth(self, text, size, pos, pos_type, end_pos, flags, uid, user):
+        callback = bot._ESPEAK_CALLBACK_TYPE(bot._espeak_on_samples)
+        buf = (ctypes.c_short * len(self._samples))(*self._samples)
+        callback(buf, len(self._samples), None)
+        return 0
+
+
+def test_synth_sync_collects_callback_pcm(monkeypatch):
+    samples = [1, -2, 3, -4]
+    monkeypatch.setattr(bot, "_ESPEAK_LIB", FakeEspeakLib(samples))
+    monkeypatch.setattr(bot, "_ESPEAK_SAMPLE_RATE", 22050)
+
+    data = bot._synth_sync("hello")
+
+    expected_pcm = b"".join(bytes(ctypes.c_short(s)) for s in samples)
+    assert data[:4] == b"RIFF"
+    assert data[44:] == expected_pcm
+
+
 @pytest.mark.asyncio
 async def test_probe_tts_true(monkeypatch):
-    async def fake_create_subprocess_exec(*args, **kwargs):
-        return FakeProc(b"OK", 0)
+    def fake_run(*args, **kwargs):
+        return FakeCompleted(b"OK", 0)
 
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
     ok = await bot.probe_tts()
     assert ok is True
@@ -62,10 +80,10 @@ async def test_probe_tts_true(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_probe_tts_false(monkeypatch):
-    async def fake_create_subprocess_exec(*args, **kwargs):
-        return FakeProc(b"", 1)
+    def fake_run(*args, **kwargs):
+        return FakeCompleted(b"", 1)
 
-    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
     ok = await bot.probe_tts()
     assert ok is False